@@ -394,7 +394,13 @@ docs:
 '''
 
 
-tpl = jinja2.Template(tpl)
+# the bytecode cache lets repeated runs skip jinja's lexer/parser for an unchanged template
+cache_dir = Path(os.path.dirname(__file__)) / '.jinja_cache'
+cache_dir.mkdir(exist_ok=True)
+jinja_env = jinja2.Environment(loader=jinja2.DictLoader({'ci.yml': tpl}),
+                               bytecode_cache=jinja2.FileSystemBytecodeCache(str(cache_dir)),
+                               auto_reload=False)
+tpl = jinja_env.get_template('ci.yml')
 pythons = ['3.7', '3.8', '3.9']
 oldest = [pythons[0]]
 newest = [pythons[-1]]
@@ -417,8 +423,11 @@ ci_image_tag = env['CI_IMAGE_TAG']
 pypi_mirror_tag = env['PYPI_MIRROR_TAG']
 registry = "zivgitlab.wwu.io/pymor/docker"
 with open(os.path.join(os.path.dirname(__file__), 'ci.yml'), 'wt') as yml:
-    matrix = [(sc, py, pa) for sc, pythons, pa in test_scripts for py in pythons]
-    yml.write(tpl.render(**locals()))
+    # matrix is iterated by two loops in the template (and uses loop.length), so it has to stay a list
+    matrix = [(sc, py, pa) for sc, pys, pa in test_scripts for py in pys]
+    context = dict(matrix=matrix, pythons=pythons, testos=testos, binder_urls=binder_urls,
+                   registry=registry, ci_image_tag=ci_image_tag, pypi_mirror_tag=pypi_mirror_tag)
+    tpl.stream(**context).dump(yml)
 
 try:
     token = sys.argv[1]
@@ -55,7 +55,7 @@ install_suggests = {
     'jupyter_contrib_nbextensions': 'modular collection of jupyter extensions',
     'pillow': 'image library used for bitmap data functions',
 }
-io_requires = ['pyevtk', 'xmljson', 'meshio>=4.4', 'lxml', 'gmsh']
+io_requires = ['pyevtk', 'xmljson', 'meshio>=4.4', 'lxml', 'gmsh', 'pandas', 'h5py']
 install_suggests.update({p: 'optional File I/O support libraries' for p in io_requires})
 doc_requires = ['sphinx>=3.4', 'matplotlib', _PYSIDE, 'ipyparallel>=6.2.5', 'python-slugify',
                 'ipywidgets', 'sphinx-qt-documentation', 'bash_kernel', 'sphinx-material',
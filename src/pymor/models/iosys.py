@@ -521,13 +521,9 @@ class LTIModel(InputStateOutputModel):
         lti
             The |LTIModel| with operators A, B, C, D, and E.
         """
-        from pymor.tools.io import load_matrix
+        from pymor.tools.io import load_matrices
 
-        A = load_matrix(A_file)
-        B = load_matrix(B_file)
-        C = load_matrix(C_file)
-        D = load_matrix(D_file) if D_file is not None else None
-        E = load_matrix(E_file) if E_file is not None else None
+        A, B, C, D, E = load_matrices([A_file, B_file, C_file, D_file, E_file])
 
         return cls.from_matrices(A, B, C, D, E, cont_time=cont_time,
                                  state_id=state_id, solver_options=solver_options,
@@ -662,14 +658,12 @@ class LTIModel(InputStateOutputModel):
         lti
             The |LTIModel| with operators A, B, C, D, and E.
         """
-        from pymor.tools.io import load_matrix
+        from pymor.tools.io import load_matrices
         import os.path
 
-        A = load_matrix(files_basename + '.A')
-        B = load_matrix(files_basename + '.B')
-        C = load_matrix(files_basename + '.C')
-        D = load_matrix(files_basename + '.D') if os.path.isfile(files_basename + '.D') else None
-        E = load_matrix(files_basename + '.E') if os.path.isfile(files_basename + '.E') else None
+        files = [files_basename + '.A', files_basename + '.B', files_basename + '.C']
+        files += [p if os.path.isfile(p) else None for p in (files_basename + '.D', files_basename + '.E')]
+        A, B, C, D, E = load_matrices(files)
 
         return cls.from_matrices(A, B, C, D, E, cont_time=cont_time,
                                  state_id=state_id, solver_options=solver_options,
@@ -1460,15 +1454,9 @@ class SecondOrderModel(InputStateOutputModel):
         som
             The |SecondOrderModel| with operators M, E, K, B, Cp, Cv, and D.
         """
-        from pymor.tools.io import load_matrix
-
-        M = load_matrix(M_file)
-        E = load_matrix(E_file)
-        K = load_matrix(K_file)
-        B = load_matrix(B_file)
-        Cp = load_matrix(Cp_file)
-        Cv = load_matrix(Cv_file) if Cv_file is not None else None
-        D = load_matrix(D_file) if D_file is not None else None
+        from pymor.tools.io import load_matrices
+
+        M, E, K, B, Cp, Cv, D = load_matrices([M_file, E_file, K_file, B_file, Cp_file, Cv_file, D_file])
 
         return cls.from_matrices(M, E, K, B, Cp, Cv, D, cont_time=cont_time,
                                  state_id=state_id, solver_options=solver_options,
@@ -2,6 +2,7 @@
 # Copyright 2013-2021 pyMOR developers and contributors. All rights reserved.
 # License: BSD 2-Clause License (https://opensource.org/licenses/BSD-2-Clause)
 
+from keyword import iskeyword
 from numbers import Number
 
 import numpy as np
@@ -147,10 +148,25 @@ class ProjectionParameterFunctional(ParameterFunctional):
 
         self.__auto_init(locals())
         self.parameters_own = {parameter: size}
+        # mutable and updated in place to avoid ImmutableObject.__setattr__ in evaluate
+        self._last_evaluation = [None, None]
 
     def evaluate(self, mu=None):
-        assert self.parameters.assert_compatible(mu)
-        return mu[self.parameter].item(self.index)
+        # |parameter values| are immutable, so we can reuse the value for the last mu
+        last_evaluation = self._last_evaluation
+        last_mu, last_value = last_evaluation
+        if mu is last_mu and mu is not None:
+            return last_value
+        if type(mu) is Mu:
+            # fast path: only a single parameter has to be checked
+            value = mu.get(self.parameter)
+            assert value is not None and value.size == self.size, self.parameters.why_incompatible(mu)
+        else:
+            assert self.parameters.assert_compatible(mu)
+            value = mu[self.parameter]
+        value = value.item(self.index)
+        last_evaluation[:] = (mu, value)
+        return value
 
     def d_mu(self, parameter, index=0):
         if parameter == self.parameter:
@@ -188,15 +204,22 @@ class GenericParameterFunctional(ParameterFunctional):
     def __init__(self, mapping, parameters, name=None, derivative_mappings=None, second_derivative_mappings=None):
         self.__auto_init(locals())
         self.parameters_own = parameters
+        # mutable and updated in place to avoid ImmutableObject.__setattr__ in evaluate
+        self._last_evaluation = [None, None]
 
     def evaluate(self, mu=None):
+        # |parameter values| are immutable, so we can reuse the value for the last mu
+        last_evaluation = self._last_evaluation
+        last_mu, last_value = last_evaluation
+        if mu is last_mu and mu is not None:
+            return last_value
         assert self.parameters.assert_compatible(mu)
         value = self.mapping(mu)
         # ensure that we return a number not an array
         if isinstance(value, np.ndarray):
-            return value.item()
-        else:
-            return value
+            value = value.item()
+        last_evaluation[:] = (mu, value)
+        return value
 
     def d_mu(self, parameter, index=0):
         if parameter in self.parameters:
@@ -268,13 +291,26 @@ class ExpressionParameterFunctional(GenericParameterFunctional):
     def __init__(self, expression, parameters, name=None, derivative_expressions=None,
                  second_derivative_expressions=None):
         self.expression = expression
-        code = compile(expression, '<expression>', 'eval')
-        functions = self.functions
-
-        def get_lambda(exp_code):
-            return lambda mu: eval(exp_code, functions, mu)
-
-        exp_mapping = get_lambda(code)
+        # all expressions share one globals dict, which is copied so that exec does not
+        # add '__builtins__' to the class attribute
+        functions = dict(self.functions)
+        # parameter names which are no valid identifiers cannot appear in an expression
+        arg_names = tuple(k for k in Parameters(parameters) if k.isidentifier() and not iskeyword(k))
+        if arg_names:
+            unpack_mu = f'    {", ".join(arg_names)}, = {", ".join(f"_mu[{k!r}]" for k in arg_names)},\n'
+        else:
+            unpack_mu = ''
+
+        def get_lambda(exp):
+            # compile the expression once into a function of mu which binds the parameter
+            # values to local variables, so that each evaluation is a single function call
+            exp_code = compile(f'def exp_function(_mu):\n{unpack_mu}    return ({exp}\n)\n',
+                               '<expression>', 'exec')
+            namespace = {}
+            exec(exp_code, functions, namespace)
+            return namespace['exp_function']
+
+        exp_mapping = get_lambda(expression)
         if derivative_expressions is not None:
             derivative_mappings = derivative_expressions.copy()
             for key, exp in derivative_mappings.items():
@@ -282,8 +318,7 @@ class ExpressionParameterFunctional(GenericParameterFunctional):
                     exp = [exp]
                 exp_array = np.array(exp, dtype=object)
                 for exp in np.nditer(exp_array, op_flags=['readwrite'], flags=['refs_ok']):
-                    exp_code = compile(str(exp), '<expression>', 'eval')
-                    mapping = get_lambda(exp_code)
+                    mapping = get_lambda(str(exp))
                     exp[...] = mapping
                 derivative_mappings[key] = exp_array
         else:
@@ -300,8 +335,7 @@ class ExpressionParameterFunctional(GenericParameterFunctional):
                             exp = [exp]
                         exp_array = np.array(exp, dtype=object)
                         for exp in np.nditer(exp_array, op_flags=['readwrite'], flags=['refs_ok']):
-                            exp_code = compile(str(exp), '<expression>', 'eval')
-                            mapping = get_lambda(exp_code)
+                            mapping = get_lambda(str(exp))
                             exp[...] = mapping
                         key_dict[()][key_j] = exp_array
                 second_derivative_mappings[key_i] = key_dicts_array
@@ -3,11 +3,10 @@
 # License: BSD 2-Clause License (https://opensource.org/licenses/BSD-2-Clause)
 
 import os
-import shutil
 import tempfile
 from contextlib import contextmanager
 
-from .matrices import load_matrix, save_matrix
+from .matrices import load_matrix, load_matrices, save_matrix
 from pymor.core.config import config
 from ..deprecated import Deprecated
 from ...core.exceptions import IOLibsMissing
@@ -42,20 +41,49 @@ def safe_temporary_filename(name=None, parent_dir=None):
     """
     parent_dir = parent_dir or tempfile.gettempdir()
     name = name or 'temp_file'
-    dirname = tempfile.mkdtemp(dir=parent_dir)
-    path = os.path.join(dirname, name)
-    yield path
-    shutil.rmtree(dirname)
+    with tempfile.TemporaryDirectory(dir=parent_dir) as dirname:
+        yield os.path.join(dirname, name)
+
+
+def _open_directory(name):
+    # with O_PATH (Linux), only search permission is required, as for chdir
+    return os.open(name, getattr(os, 'O_PATH', os.O_RDONLY) | os.O_DIRECTORY)
 
 
 @contextmanager
 def change_to_directory(name):
     """Change current working directory to `name` for the scope of the context."""
-    old_cwd = os.getcwd()
+    old_cwd = None
+    if hasattr(os, 'fchdir') and hasattr(os, 'O_DIRECTORY'):
+        try:
+            old_cwd = _open_directory(os.curdir)
+        except PermissionError:
+            pass
+
+    if old_cwd is None:
+        old_cwd = os.getcwd()
+        try:
+            yield os.chdir(name)
+        finally:
+            os.chdir(old_cwd)
+        return
+
+    # using file descriptors, we return to the original directory even if it has been renamed
     try:
-        yield os.chdir(name)
+        try:
+            new_cwd = _open_directory(name)
+        except PermissionError:
+            # without O_PATH, opening requires read permission, which chdir does not need
+            os.chdir(name)
+        else:
+            try:
+                os.fchdir(new_cwd)
+            finally:
+                os.close(new_cwd)
+        yield
     finally:
-        os.chdir(old_cwd)
+        os.fchdir(old_cwd)
+        os.close(old_cwd)
 
 
 def file_owned_by_current_user(filename):
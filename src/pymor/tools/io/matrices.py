@@ -2,35 +2,99 @@
 # Copyright 2013-2021 pyMOR developers and contributors. All rights reserved.
 # License: BSD 2-Clause License (https://opensource.org/licenses/BSD-2-Clause)
 
+import gzip
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import numpy as np
+from packaging.version import Version
 from scipy.io import loadmat, mmread, mmwrite, savemat
 from scipy.sparse import issparse
 
+from pymor.core.config import config
 from pymor.core.logger import getLogger
 
 
-def _loadmat(path, key=None):
+def _is_hdf5(path):
+    import h5py
+    return h5py.is_hdf5(path)
+
+
+_MATLAB_NUMERIC_CLASSES = {'double': np.float64, 'single': np.float32,
+                           'int8': np.int8, 'uint8': np.uint8, 'int16': np.int16, 'uint16': np.uint16,
+                           'int32': np.int32, 'uint32': np.uint32, 'int64': np.int64, 'uint64': np.uint64}
+
+
+def _loadmat_hdf5(path, key=None):
+    # MATLAB v7.3 files are HDF5 files, which are not supported by scipy.io.loadmat
+    import h5py
+    from scipy.sparse import csc_matrix
+
+    def read_values(dataset):
+        value = dataset[()]
+        if value.dtype.names == ('real', 'imag'):
+            value = value['real'] + 1j * value['imag']
+        # MATLAB stores arrays in column-major order
+        return value.T
+
+    def read(obj):
+        matlab_class = obj.attrs.get('MATLAB_class', b'double')
+        if isinstance(matlab_class, bytes):
+            matlab_class = matlab_class.decode()
+        # char, logical, cell, struct, etc. variables are no matrices
+        if matlab_class not in _MATLAB_NUMERIC_CLASSES:
+            return None
+        dtype = _MATLAB_NUMERIC_CLASSES[matlab_class]
+        if isinstance(obj, h5py.Group):
+            if 'MATLAB_sparse' not in obj.attrs:
+                return None
+            shape = (int(obj.attrs['MATLAB_sparse']), len(obj['jc']) - 1)
+            # data and ir are omitted for sparse matrices without non-zero entries
+            if 'data' in obj:
+                data, indices = read_values(obj['data']), obj['ir'][()]
+            else:
+                data, indices = np.empty(0, dtype=dtype), np.empty(0, dtype=np.int64)
+            return csc_matrix((data, indices, obj['jc'][()]), shape=shape)
+        if obj.attrs.get('MATLAB_empty', 0):
+            # empty arrays are stored as a vector of their dimensions
+            return np.empty(tuple(int(d) for d in np.ravel(obj[()])), dtype=dtype)
+        return read_values(obj)
+
+    with h5py.File(path, 'r') as f:
+        if key:
+            return {key: read(f[key])} if key in f else {}
+        return {k: read(v) for k, v in f.items() if not k.startswith('#')}
+
+
+def _loadmat(path, key=None, **kwargs):
     try:
-        data = loadmat(path, mat_dtype=True)
+        if config.HAVE_H5PY and _is_hdf5(path):
+            data = _loadmat_hdf5(path, key)
+        else:
+            data = loadmat(path, mat_dtype=True)
     except Exception as e:
         raise IOError(e)
 
     if key:
         try:
-            return data[key]
+            matrix = data[key]
         except KeyError:
             raise IOError(f'"{key}" not found in MATLAB file {path}')
+        # _loadmat_hdf5 returns None for variables which are no matrices (e.g. structs)
+        if matrix is None:
+            raise IOError(f'"{key}" is not a matrix in MATLAB file {path}')
+        return matrix
 
-    data = [v for v in data.values() if isinstance(v, np.ndarray) or issparse(v)]
+    # stop as soon as a second matrix is found
+    matrices = (v for v in data.values() if isinstance(v, np.ndarray) or issparse(v))
+    matrix = next(matrices, None)
 
-    if len(data) == 0:
+    if matrix is None:
         raise IOError(f'No matrix data contained in MATLAB file {path}')
-    elif len(data) > 1:
+    elif next(matrices, None) is not None:
         raise IOError(f'More than one matrix object stored in MATLAB file {path}')
     else:
-        return data[0]
+        return matrix
 
 
 def _savemat(path, matrix, key=None):
@@ -42,14 +106,14 @@ def _savemat(path, matrix, key=None):
         raise IOError(e)
 
 
-def _mmread(path, key=None):
+def _mmread(path, key=None, **kwargs):
     if key:
         raise IOError('Cannot specify "key" for Matrix Market file')
     try:
-        matrix = mmread(path)
-        if issparse(matrix):
-            matrix = matrix.tocsc()
-        return matrix
+        if path.suffix.lower() != '.gz':
+            return mmread(path)
+        with gzip.open(path, 'rb') as f:
+            return mmread(f)
     except Exception as e:
         raise IOError(e)
 
@@ -58,10 +122,9 @@ def _mmwrite(path, matrix, key=None):
     if key:
         raise IOError('Cannot specify "key" for Matrix Market file')
     try:
-        if path.suffix != '.gz':
+        if path.suffix.lower() != '.gz':
             open_file = open
         else:
-            import gzip
             open_file = gzip.open
         with open_file(path, 'wb') as f:
             # when mmwrite is given a string, it will append '.mtx'
@@ -70,9 +133,10 @@ def _mmwrite(path, matrix, key=None):
         raise IOError(e)
 
 
-def _load(path, key=None):
+def _load(path, key=None, mmap=False):
     try:
-        data = np.load(path)
+        # mmap_mode is ignored by np.load for NPZ files
+        data = np.load(path, mmap_mode='r' if mmap else None)
     except Exception as e:
         raise IOError(e)
     if isinstance(data, (dict, np.lib.npyio.NpzFile)):
@@ -113,15 +177,41 @@ def _savez(path, matrix, key=None):
         raise IOError(e)
 
 
-def _loadtxt(path, key=None):
+def _loadtxt(path, key=None, **kwargs):
     if key:
         raise IOError('Cannot specify "key" for TXT file')
     try:
-        return np.loadtxt(path)
+        matrix = _read_csv(path) if config.HAVE_PANDAS and not _NUMPY_HAS_C_LOADTXT else None
+        return np.loadtxt(path) if matrix is None else matrix
     except Exception as e:
         raise IOError(e)
 
 
+# np.loadtxt is implemented in C since NumPy 1.23
+_NUMPY_HAS_C_LOADTXT = Version(np.__version__) >= Version('1.23')
+
+
+def _read_csv(path):
+    # pandas' C parser is much faster than the pure Python np.loadtxt of NumPy < 1.23.
+    # Returns None if the result might differ from np.loadtxt, which is then used instead.
+    from csv import QUOTE_NONE
+    from pandas import read_csv
+    from pandas.errors import EmptyDataError, ParserError
+    try:
+        # round_trip parsing is required for correctly rounded floats, quoted fields are
+        # not accepted by np.loadtxt
+        matrix = read_csv(path, sep=r'\s+', header=None, comment='#', dtype=np.float64,
+                          float_precision='round_trip', quoting=QUOTE_NONE).to_numpy()
+    except (EmptyDataError, ParserError, ValueError):
+        return None
+    # pandas fills missing fields of short rows with NaN, whereas np.loadtxt fails
+    if np.isnan(matrix).any():
+        return None
+    # np.loadtxt removes singleton dimensions and returns C-contiguous arrays
+    matrix = np.squeeze(matrix)
+    return matrix if matrix.flags.c_contiguous else matrix.copy(order='C')
+
+
 def _savetxt(path, matrix, key=None):
     if key:
         raise IOError('Cannot specify "key" for TXT file')
@@ -132,17 +222,64 @@ def _savetxt(path, matrix, key=None):
 
 
 def _get_file_extension(path):
-    suffix_count = len(path.suffixes)
-    if suffix_count and len(path.suffixes[-1]) == 4:
-        extension = path.suffixes[-1].lower()
-    elif path.suffixes[-1].lower() == '.gz' and suffix_count >= 2 and len(path.suffixes[-2]) == 4:
-        extension = ''.join(path.suffixes[-2:]).lower()
+    name = path.name.lower()
+    if name.endswith('.gz'):
+        name, gz = name[:-3], '.gz'
     else:
-        extension = ''
-    return extension
+        gz = ''
+    stem, dot, suffix = name.rpartition('.')
+    if stem and len(suffix) == 3:
+        return dot + suffix + gz
+    else:
+        return ''
+
+
+_LOAD_FILE_FORMAT_MAP = {
+    '.mat': ('MATLAB', _loadmat),
+    '.mtx': ('Matrix Market', _mmread),
+    '.mtx.gz': ('Matrix Market', _mmread),
+    # '.mtz.gz' is kept for files written by older versions of pyMOR
+    '.mtz.gz': ('Matrix Market', _mmread),
+    '.npy': ('NPY/NPZ', _load),
+    '.npz': ('NPY/NPZ', _load),
+    '.txt': ('Text', _loadtxt),
+}
+
+# magic numbers at the start of the file for formats which are detected when the extension is unknown
+_FILE_MAGIC_MAP = (
+    (b'\x93NUMPY', ('NPY/NPZ', _load)),
+    (b'PK\x03\x04', ('NPY/NPZ', _load)),
+    (b'MATLAB', ('MATLAB', _loadmat)),
+    (b'%%MatrixMarket', ('Matrix Market', _mmread)),
+)
+
+_FALLBACK_LOADERS = (_loadmat, _mmread, _loadtxt, _load)
+
+_SAVE_FILE_FORMAT_MAP = {
+    '.mat': ('MATLAB', _savemat),
+    '.mtx': ('Matrix Market', _mmwrite),
+    '.mtx.gz': ('Matrix Market', _mmwrite),
+    # '.mtz.gz' is kept for files written by older versions of pyMOR
+    '.mtz.gz': ('Matrix Market', _mmwrite),
+    '.npy': ('NPY', _save),
+    '.npz': ('NPZ', _savez),
+    '.txt': ('Text', _savetxt),
+}
+
+
+def _get_file_format_from_magic(path):
+    try:
+        with open(path, 'rb') as f:
+            head = f.read(16)
+    except OSError:
+        return None
+    for magic, file_format in _FILE_MAGIC_MAP:
+        if head.startswith(magic):
+            return file_format
+    return None
 
 
-def load_matrix(path, key=None):
+def load_matrix(path, key=None, *, sparse_format='csc', mmap=False):
     """Load matrix from file.
 
     Parameters
@@ -151,6 +288,15 @@ def load_matrix(path, key=None):
         Path to the file (`str` or `pathlib.Path`).
     key
         Key of the matrix (only for NPY, NPZ, and MATLAB files).
+    sparse_format
+        Format to which sparse matrices are converted (e.g., `'csc'`, `'csr'`).
+        If `None`, sparse matrices are returned in the format they are loaded in
+        (COO for Matrix Market files), avoiding the conversion.
+    mmap
+        If `True`, NPY files are memory-mapped read-only instead of being read
+        into memory, such that only the parts of the matrix which are accessed
+        are read from disk. The file stays mapped until the returned array is
+        deleted. Ignored for all other file formats.
 
     Returns
     -------
@@ -169,32 +315,68 @@ def load_matrix(path, key=None):
     path = Path(path)
     extension = _get_file_extension(path)
 
-    file_format_map = {
-        '.mat': ('MATLAB', _loadmat),
-        '.mtx': ('Matrix Market', _mmread),
-        '.mtz.gz': ('Matrix Market', _mmread),
-        '.npy': ('NPY/NPZ', _load),
-        '.npz': ('NPY/NPZ', _load),
-        '.txt': ('Text', _loadtxt),
-    }
+    def load(loader):
+        # loaders ignore keyword arguments which do not apply to their file format
+        matrix = loader(path, key, mmap=mmap)
+        if sparse_format is not None and issparse(matrix):
+            matrix = matrix.asformat(sparse_format)
+        return matrix
 
-    if extension in file_format_map:
-        file_type, loader = file_format_map[extension]
-        logger.info(file_type + ' file detected.')
-        return loader(path, key)
+    file_format = _LOAD_FILE_FORMAT_MAP.get(extension) or _get_file_format_from_magic(path)
+    if file_format:
+        file_type, loader = file_format
+        logger.info('%s file detected.', file_type)
+        return load(loader)
 
     logger.warning('Could not detect file format. Trying all loaders ...')
 
-    loaders = [_loadmat, _mmread, _loadtxt, _load]
-    for loader in loaders:
+    for loader in _FALLBACK_LOADERS:
         try:
-            return loader(path, key)
+            return load(loader)
         except IOError:
             pass
 
     raise IOError(f'Could not load file {path} (key = {key})')
 
 
+def load_matrices(paths, key=None, max_workers=None, *, sparse_format='csc', mmap=False):
+    """Load several matrices from files in parallel.
+
+    The files are loaded using :func:`load_matrix` in a thread pool, such that
+    reading and parsing of different files can overlap.
+
+    Parameters
+    ----------
+    paths
+        List of paths to the files (`str` or `pathlib.Path`). `None` entries
+        are passed through.
+    key
+        Key of the matrices (only for NPY, NPZ, and MATLAB files).
+    max_workers
+        Maximum number of threads to use. If `None`, the default of
+        :class:`~concurrent.futures.ThreadPoolExecutor` is used.
+    sparse_format
+        See :func:`load_matrix`.
+    mmap
+        See :func:`load_matrix`.
+
+    Returns
+    -------
+    matrices
+        List of |NumPy arrays| or |SciPy spmatrices|.
+
+    Raises
+    ------
+    IOError
+        If loading fails.
+    """
+    def load(path):
+        return None if path is None else load_matrix(path, key, sparse_format=sparse_format, mmap=mmap)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(load, paths))
+
+
 def save_matrix(path, matrix, key=None):
     """Save matrix to file.
 
@@ -219,18 +401,9 @@ def save_matrix(path, matrix, key=None):
     path = Path(path)
     extension = _get_file_extension(path)
 
-    file_format_map = {
-        '.mat': ('MATLAB', _savemat),
-        '.mtx': ('Matrix Market', _mmwrite),
-        '.mtz.gz': ('Matrix Market', _mmwrite),
-        '.npy': ('NPY', _save),
-        '.npz': ('NPZ', _savez),
-        '.txt': ('Text', _savetxt),
-    }
-
-    if extension in file_format_map:
-        file_type, saver = file_format_map[extension]
-        logger.info(file_type + ' file detected.')
+    if extension in _SAVE_FILE_FORMAT_MAP:
+        file_type, saver = _SAVE_FILE_FORMAT_MAP[extension]
+        logger.info('%s file detected.', file_type)
         return saver(path, matrix, key)
 
     raise IOError(f'Unknown extension "{extension}"')
@@ -2,7 +2,8 @@
 # Copyright 2013-2021 pyMOR developers and contributors. All rights reserved.
 # License: BSD 2-Clause License (https://opensource.org/licenses/BSD-2-Clause)
 
-from pymor.parameters.functionals import ProjectionParameterFunctional, ExpressionParameterFunctional
+from pymor.parameters.functionals import (ProjectionParameterFunctional, ExpressionParameterFunctional,
+                                          GenericParameterFunctional)
 from pymor.basic import Mu
 
 
@@ -53,3 +54,36 @@ def test_LincombParameterFunctional():
     assert len(three_pf_named.coefficients) != len(three_pf_.coefficients)
     assert pf_times_pf_squared_named(mu) == pf_times_pf_squared(mu)
     assert len(pf_times_pf_squared_named.factors) != len(pf_times_pf_squared.factors)
+
+
+def test_ExpressionParameterFunctional():
+    epf = ExpressionParameterFunctional('sum([mu[i] * nu[0] for i in range(2)]) + exp(nu[0] - 1)',
+                                        {'mu': 2, 'nu': 1},
+                                        derivative_expressions={'nu': 'sum(mu) + exp(nu[0] - 1)'})
+    mu = Mu({'mu': [10, 2], 'nu': [1]})
+
+    assert epf(mu) == 13
+    assert epf.d_mu('nu', 0)(mu) == 13
+
+
+def test_GenericParameterFunctional_reuses_last_evaluation():
+    calls = []
+
+    def mapping(mu):
+        calls.append(mu)
+        return 2 * mu['mu'][0]
+
+    gpf = GenericParameterFunctional(mapping, {'mu': 1})
+    pf = ProjectionParameterFunctional('mu')
+    mu = Mu({'mu': [1]})
+    assert gpf(mu) == 2
+    assert gpf(mu) == 2
+    assert len(calls) == 1
+    assert pf(mu) == pf(mu) == 1
+
+    mu2 = Mu({'mu': [3]})
+    assert gpf(mu2) == 6
+    assert len(calls) == 2
+    assert pf(mu2) == 3
+    assert gpf(mu) == 2
+    assert len(calls) == 3
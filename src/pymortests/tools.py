@@ -199,7 +199,195 @@ def test_load_matrix(loadable_matrices):
             load_matrix(m)
 
 
-@pytest.mark.parametrize('ext', ['.mat', '.mtx', '.mtz.gz', '.npy', '.npz', '.txt'])
+@pytest.mark.parametrize('content', ['1 2 3\n4 5\n', '1 2\n3 4 5\n', '1 2 3\n', '1\n2\n3\n', '1\n',
+                                     '# comment\n1 nan\n3 4\n', '"1" 2\n', ''])
+def test_load_matrix_txt(content):
+    import warnings
+    from pymor.tools.io import load_matrix
+    with tempfile.TemporaryDirectory() as tmpdirname:
+        path = os.path.join(tmpdirname, 'matrix.txt')
+        with open(path, 'wt') as f:
+            f.write(content)
+        with warnings.catch_warnings():
+            # np.loadtxt warns about empty files
+            warnings.simplefilter('ignore')
+            try:
+                expected = np.loadtxt(path)
+            except ValueError:
+                expected = None
+            if expected is None:
+                with pytest.raises(IOError):
+                    load_matrix(path)
+            else:
+                A = load_matrix(path)
+                assert A.shape == expected.shape
+                assert A.flags.c_contiguous
+                np.testing.assert_array_equal(A, expected)
+
+
+@pytest.mark.parametrize('ext', ['.mat', '.npy', '.npz', '.txt'])
+def test_save_load_matrix_exact(ext):
+    from pymor.tools.io import load_matrix, save_matrix
+    A = np.random.RandomState(0).randn(30, 20) * 10.**np.arange(-10, 10)
+    key = 'A' if ext == '.mat' else None
+    with tempfile.TemporaryDirectory() as tmpdirname:
+        path = os.path.join(tmpdirname, 'matrix' + ext)
+        save_matrix(path, A, key)
+        B = load_matrix(path, key)
+    assert np.array_equal(A, B)
+
+
+def test_load_matrices():
+    from pymor.tools.io import load_matrices, save_matrix
+    A, B = np.eye(2), np.arange(6.).reshape((2, 3))
+    with tempfile.TemporaryDirectory() as tmpdirname:
+        paths = [os.path.join(tmpdirname, name) for name in ('A.npy', 'B.txt')]
+        save_matrix(paths[0], A)
+        save_matrix(paths[1], B)
+        A2, B2, C2 = load_matrices(paths + [None])
+    assert np.all(A == A2)
+    assert np.all(B == B2)
+    assert C2 is None
+
+
+@pytest.mark.parametrize('ext', ['.mat', '.mtx', '.npy', '.npz'])
+def test_load_matrix_without_extension(ext):
+    from pymor.tools.io import load_matrix, save_matrix
+    A = np.eye(2)
+    key = 'A' if ext in ('.mat', '.npz') else None
+    with tempfile.TemporaryDirectory() as tmpdirname:
+        path = os.path.join(tmpdirname, 'matrix' + ext)
+        save_matrix(path, A, key)
+        path2 = os.path.join(tmpdirname, 'matrix')
+        os.rename(path, path2)
+        B = load_matrix(path2, key)
+    assert np.all(A == B)
+
+
+def _write_mat_v73(path, variables):
+    """Write `variables` to `path` using the HDF5 layout of MATLAB v7.3 files.
+
+    Values given as `(data, attrs)` tuples are written verbatim as datasets.
+    """
+    import h5py
+    from scipy.sparse import issparse
+    with h5py.File(path, 'w', userblock_size=512) as f:
+        for name, value in variables.items():
+            if isinstance(value, tuple):
+                data, attrs = value
+                f[name] = data
+                for k, v in attrs.items():
+                    f[name].attrs[k] = v
+            elif issparse(value):
+                value = value.tocsc()
+                group = f.create_group(name)
+                group.attrs['MATLAB_class'] = np.bytes_('double')
+                group.attrs['MATLAB_sparse'] = np.uint64(value.shape[0])
+                # like MATLAB, omit data and ir if there are no non-zero entries
+                if value.nnz:
+                    group['data'] = value.data
+                    group['ir'] = value.indices.astype(np.uint64)
+                group['jc'] = value.indptr.astype(np.uint64)
+            elif isinstance(value, dict):
+                group = f.create_group(name)
+                group.attrs['MATLAB_class'] = np.bytes_('struct')
+                for k, v in value.items():
+                    group[k] = np.asarray(v).T
+            else:
+                if np.iscomplexobj(value):
+                    complex_value = np.empty(value.shape, dtype=[('real', np.float64), ('imag', np.float64)])
+                    complex_value['real'], complex_value['imag'] = value.real, value.imag
+                    value = complex_value
+                # MATLAB stores arrays in column-major order
+                f[name] = value.T
+                f[name].attrs['MATLAB_class'] = np.bytes_('double')
+    with open(path, 'r+b') as f:
+        f.write(b'MATLAB 7.3 MAT-file'.ljust(128))
+
+
+@pytest.mark.skipif(not config.HAVE_H5PY, reason='h5py missing')
+def test_load_matrix_mat_v73():
+    from scipy.sparse import csr_matrix, issparse
+    from pymor.tools.io import load_matrix
+    A = np.arange(6.).reshape((2, 3))
+    C = A + 1j * A[::-1]
+    S = csr_matrix(np.array([[1., 0., 0.], [0., 0., 2.]]))
+    # layouts as written by MATLAB for zeros(0, 3), sparse(2, 3), 'ab' and [true, false]
+    E = (np.array([0, 3], dtype=np.uint64), {'MATLAB_class': np.bytes_('double'), 'MATLAB_empty': np.uint8(1)})
+    SE = csr_matrix((2, 3))
+    chars = (np.array([[97], [98]], dtype=np.uint16),
+             {'MATLAB_class': np.bytes_('char'), 'MATLAB_int_decode': np.int32(2)})
+    L = (np.array([[1], [0]], dtype=np.uint8),
+         {'MATLAB_class': np.bytes_('logical'), 'MATLAB_int_decode': np.int32(1)})
+    with tempfile.TemporaryDirectory() as tmpdirname:
+        path = os.path.join(tmpdirname, 'matrices.mat')
+        _write_mat_v73(path, {'A': A, 'C': C, 'S': S, 'E': E, 'SE': SE, 'chars': chars, 'L': L,
+                              'st': {'x': A}})
+
+        B = load_matrix(path, 'A')
+        assert B.shape == A.shape
+        assert np.all(A == B)
+        B = load_matrix(path, 'C')
+        assert B.shape == C.shape
+        assert np.all(C == B)
+        B = load_matrix(path, 'S')
+        assert issparse(B)
+        assert B.shape == S.shape
+        assert np.all(S.toarray() == B.toarray())
+        B = load_matrix(path, 'E')
+        assert isinstance(B, np.ndarray)
+        assert B.shape == (0, 3)
+        B = load_matrix(path, 'SE')
+        assert issparse(B)
+        assert B.shape == (2, 3)
+        assert B.nnz == 0
+        for key in ('st', 'chars', 'L'):
+            with pytest.raises(IOError):
+                load_matrix(path, key)
+        with pytest.raises(IOError):
+            load_matrix(path, 'missing')
+        with pytest.raises(IOError):
+            load_matrix(path)
+
+        path = os.path.join(tmpdirname, 'matrix.mat')
+        _write_mat_v73(path, {'A': A, 'st': {'x': A}, 'chars': chars, 'L': L})
+        B = load_matrix(path)
+        assert np.all(A == B)
+
+
+@pytest.mark.parametrize('ext', ['.mat', '.mtx'])
+@pytest.mark.parametrize('sparse_format', ['csc', 'csr', None])
+def test_load_matrix_sparse_format(ext, sparse_format):
+    from scipy.sparse import csr_matrix, issparse
+    from pymor.tools.io import load_matrix, save_matrix
+    A = csr_matrix(np.array([[1., 0., 0.], [0., 0., 2.]]))
+    key = 'A' if ext == '.mat' else None
+    with tempfile.TemporaryDirectory() as tmpdirname:
+        path = os.path.join(tmpdirname, 'matrix' + ext)
+        save_matrix(path, A, key)
+        B = load_matrix(path, key, sparse_format=sparse_format)
+    assert issparse(B)
+    if sparse_format is None:
+        # formats as returned by scipy.io.loadmat and scipy.io.mmread
+        assert B.format == {'.mat': 'csc', '.mtx': 'coo'}[ext]
+    else:
+        assert B.format == sparse_format
+    assert np.all(A.toarray() == B.toarray())
+
+
+def test_load_matrix_mmap():
+    from pymor.tools.io import load_matrix, save_matrix
+    A = np.eye(2)
+    with tempfile.TemporaryDirectory() as tmpdirname:
+        path = os.path.join(tmpdirname, 'matrix.npy')
+        save_matrix(path, A)
+        B = load_matrix(path, mmap=True)
+        assert isinstance(B, np.memmap)
+        assert np.all(A == B)
+        del B
+
+
+@pytest.mark.parametrize('ext', ['.mat', '.mtx', '.mtx.gz', '.mtz.gz', '.npy', '.npz', '.txt'])
 def test_save_load_matrix(ext):
     import filecmp
     from pymor.tools.io import load_matrix, save_matrix
@@ -215,7 +403,7 @@ def test_save_load_matrix(ext):
         path2 = os.path.join(tmpdirname, 'matrix2' + ext)
         save_matrix(path2, A, key)
         # .mat save a timestamp, so full file cmp os too flaky
-        if ext not in ('.mtz.gz', '.mat'):
+        if ext not in ('.mtx.gz', '.mtz.gz', '.mat'):
             assert filecmp.cmp(path, path2)
 
 
@@ -231,6 +419,33 @@ def test_cwd_ctx_manager():
     assert _cwd() == original_cwd
 
 
+@pytest.mark.skipif(not hasattr(os, 'fchdir'), reason='directories cannot be renamed while being the cwd')
+def test_cwd_ctx_manager_renamed_cwd():
+    with tempfile.TemporaryDirectory() as tmpdirname:
+        tmpdir = Path(tmpdirname).resolve()
+        original, target, renamed = tmpdir / 'original', tmpdir / 'target', tmpdir / 'renamed'
+        original.mkdir()
+        target.mkdir()
+        with change_to_directory(original):
+            with change_to_directory(target):
+                original.rename(renamed)
+            assert Path(os.getcwd()).resolve() == renamed
+
+
+@pytest.mark.skipif(not hasattr(os, 'geteuid') or os.geteuid() == 0,
+                    reason='requires POSIX permissions and a non-root user')
+def test_cwd_ctx_manager_search_permission_only():
+    with tempfile.TemporaryDirectory() as tmpdirname:
+        target = Path(tmpdirname).resolve() / 'target'
+        target.mkdir(mode=0o711)
+        try:
+            os.chmod(target, 0o311)
+            with change_to_directory(target):
+                assert Path(os.getcwd()).resolve() == target
+        finally:
+            os.chmod(target, 0o711)
+
+
 def test_deprecated_tmp():
     """This test should be removed alongside SafeTemporaryFileName after the next release"""
     from pymor.tools.io import SafeTemporaryFileName